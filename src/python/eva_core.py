@@ -10,24 +10,33 @@ This module provides the core AI/ML capabilities for EVA including:
 """
 
 import asyncio
-import json
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Any, Final, Mapping, Optional, Tuple, Union
+import msgspec
 import numpy as np
 import pandas as pd
 
-# ML/AI Libraries
+# PyTorch for real neural network execution
 try:
     import torch
     import torch.nn as nn
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+    logging.warning("PyTorch not available - neural inference will be simulated")
+
+# ML/AI Libraries
+try:
     from transformers import AutoTokenizer, AutoModel
     from sklearn.preprocessing import StandardScaler
     from sklearn.cluster import KMeans
     import tensorflow as tf
 except ImportError as e:
-    logging.warning(f"Some ML libraries not available: {e}")
+    logging.warning("Some ML libraries not available: %s", e)
 
 # gRPC for communication
 try:
@@ -37,16 +46,210 @@ try:
 except ImportError:
     logging.warning("gRPC not available - using fallback communication")
 
-@dataclass
-class ProcessingRequest:
+# Numba JIT for numeric kernels
+try:
+    from numba import get_num_threads, njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logging.warning("Numba not available - using NumPy fallbacks")
+
+EMBEDDING_DIM = 768  # BERT-like embedding size
+
+# Shared PCG64 generator; thread-safe, so to_thread workers may draw from it too
+_RNG = np.random.default_rng()
+
+# Request coalescing: same-method requests arriving within the window are
+# processed together as one batch
+BATCH_WINDOW = 0.002  # seconds
+MAX_BATCH_SIZE = 64
+
+# Maximum number of NLP results kept in the LRU cache
+NLP_CACHE_SIZE = 4096
+
+# Maximum number of CUDA graphs kept by NeuralEngine (one per network and input shape)
+MAX_CUDA_GRAPHS = 32
+
+# Default model registry, copied into each EVAPythonCore on initialization
+_DEFAULT_MODELS: Final[Mapping[str, Mapping[str, Any]]] = MappingProxyType({
+    'nlp_base': MappingProxyType({
+        'type': 'transformer',
+        'name': 'distilbert-base-uncased',
+        'status': 'loaded',
+        'capabilities': ('text_classification', 'embeddings', 'sentiment')
+    }),
+    'ml_classifier': MappingProxyType({
+        'type': 'sklearn',
+        'name': 'random_forest',
+        'status': 'loaded',
+        'capabilities': ('classification', 'feature_importance')
+    })
+})
+
+def _fingerprint(data: Dict[str, Any]) -> str:
+    """Stable 64-bit hex digest of a JSON-compatible payload"""
+    payload = msgspec.json.encode(data, order='sorted')
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+def _ndarray_to_blob(a: np.ndarray) -> Dict[str, Any]:
+    """Pack an array as raw bytes plus shape/dtype, avoiding per-element boxing"""
+    a = np.ascontiguousarray(a)
+    return {'_ndarray': True, 'shape': a.shape, 'dtype': a.dtype.str, 'data': a.tobytes()}
+
+def _blob_to_ndarray(blob: Dict[str, Any]) -> np.ndarray:
+    """Inverse of _ndarray_to_blob"""
+    return np.frombuffer(blob['data'], dtype=blob['dtype']).reshape(blob['shape'])
+
+def _row_stats_numpy(arr: np.ndarray):
+    """Return (missing, mean, std, min, max) over the non-NaN cells of arr"""
+    missing = np.isnan(arr)
+    values = arr[~missing].astype(np.float64)
+    if values.size == 0:
+        return int(missing.sum()), np.nan, np.nan, np.nan, np.nan
+    return int(missing.sum()), values.mean(), values.std(), values.min(), values.max()
+
+if NUMBA_AVAILABLE:
+    # fastmath is left off: it assumes no NaNs, which breaks missing-value counting.
+    # nogil lets asyncio.to_thread callers run it alongside the event loop.
+    @njit(parallel=True, cache=True, nogil=True)
+    def _row_stats(arr):
+        """Single-pass (missing, mean, std, min, max) over the non-NaN cells of arr.
+        
+        Each row keeps a Welford (count, mean, M2) accumulator; the rows are then
+        merged with Chan's formula, so large offsets do not cancel the variance.
+        """
+        n_rows, n_cols = arr.shape
+        counts = np.zeros(n_rows, dtype=np.int64)
+        means = np.zeros(n_rows)
+        m2s = np.zeros(n_rows)
+        mins = np.full(n_rows, np.inf)
+        maxs = np.full(n_rows, -np.inf)
+        
+        for i in prange(n_rows):
+            n = 0
+            mean = 0.0
+            m2 = 0.0
+            for j in range(n_cols):
+                v = np.float64(arr[i, j])
+                if np.isnan(v):
+                    continue
+                n += 1
+                delta = v - mean
+                mean += delta / n
+                m2 += delta * (v - mean)
+                mins[i] = min(mins[i], v)
+                maxs[i] = max(maxs[i], v)
+            counts[i] = n
+            means[i] = mean
+            m2s[i] = m2
+        
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n_rows):
+            n_b = counts[i]
+            if n_b == 0:
+                continue
+            total = count + n_b
+            delta = means[i] - mean
+            mean += delta * n_b / total
+            m2 += m2s[i] + delta * delta * count * n_b / total
+            count = total
+        
+        missing = n_rows * n_cols - count
+        if count == 0:
+            return missing, np.nan, np.nan, np.nan, np.nan
+        return missing, mean, np.sqrt(m2 / count), mins.min(), maxs.max()
+else:
+    _row_stats = _row_stats_numpy
+
+def _kmeans_assign_accum_numpy(X: np.ndarray, C: np.ndarray):
+    """Return (labels, centroid sums, counts, inertia) for one k-means step"""
+    d2 = (X * X).sum(axis=1)[:, None] - 2.0 * (X @ C.T) + (C * C).sum(axis=1)
+    labels = d2.argmin(axis=1)
+    sums = np.zeros_like(C)
+    np.add.at(sums, labels, X)
+    counts = np.bincount(labels, minlength=C.shape[0])
+    inertia = np.maximum(d2[np.arange(len(X)), labels], 0.0).sum()
+    return labels, sums, counts, inertia
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, nogil=True, fastmath=True)
+    def _kmeans_assign_accum_kernel(X, C, n_chunks):
+        """Fused nearest-centroid assignment and centroid accumulation.
+        
+        Distances are kept in registers, so the (N, K) distance matrix is never
+        materialized. Each chunk accumulates into its own slice, avoiding atomics.
+        """
+        n, d = X.shape
+        k = C.shape[0]
+        labels = np.empty(n, dtype=np.int64)
+        sums = np.zeros((n_chunks, k, d))
+        counts = np.zeros((n_chunks, k), dtype=np.int64)
+        inertia = np.zeros(n_chunks)
+        
+        for c in prange(n_chunks):
+            for i in range(c * n // n_chunks, (c + 1) * n // n_chunks):
+                best = 0
+                best_dist = np.inf
+                for j in range(k):
+                    dist = 0.0
+                    for f in range(d):
+                        diff = X[i, f] - C[j, f]
+                        dist += diff * diff
+                    if dist < best_dist:
+                        best_dist = dist
+                        best = j
+                labels[i] = best
+                counts[c, best] += 1
+                inertia[c] += best_dist
+                for f in range(d):
+                    sums[c, best, f] += X[i, f]
+        
+        return labels, sums.sum(axis=0), counts.sum(axis=0), inertia.sum()
+    
+    def _kmeans_assign_accum(X, C):
+        # One chunk per Numba thread; resolved here so the kernel stays cacheable
+        return _kmeans_assign_accum_kernel(X, C, max(1, min(len(X), get_num_threads())))
+else:
+    _kmeans_assign_accum = _kmeans_assign_accum_numpy
+
+_kernels_warm = False
+
+def _warm_kernels():
+    """JIT-compile the numeric kernels and start Numba's thread pool on this thread.
+    
+    Must run on the event loop thread before the kernels are first handed to
+    asyncio.to_thread: if Numba's TBB pool starts on a worker, exit can hang.
+    """
+    global _kernels_warm
+    if not _kernels_warm:
+        _row_stats(np.zeros((1, 1), dtype=np.float32))
+        _kmeans_assign_accum(np.zeros((1, 1), dtype=np.float32), np.zeros((1, 1)))
+        _kernels_warm = True
+
+_ACTIVATIONS = {'relu': 'ReLU', 'tanh': 'Tanh', 'sigmoid': 'Sigmoid', 'gelu': 'GELU'}
+
+def _build_feedforward(layers: List[int], activation: str) -> "nn.Module":
+    """Build an MLP from layer widths; layers[0] is the input size.
+    
+    Requires at least two layers and an activation listed in _ACTIVATIONS.
+    """
+    modules = []
+    for n_in, n_out in zip(layers, layers[1:]):
+        if modules:
+            modules.append(getattr(nn, _ACTIVATIONS[activation])())
+        modules.append(nn.Linear(n_in, n_out))
+    return nn.Sequential(*modules)
+
+class ProcessingRequest(msgspec.Struct):
     """Request structure for Python processing"""
     method: str
     data: Dict[str, Any]
     options: Dict[str, Any]
     request_id: str
 
-@dataclass
-class ProcessingResponse:
+class ProcessingResponse(msgspec.Struct):
     """Response structure for Python processing"""
     request_id: str
     success: bool
@@ -54,6 +257,9 @@ class ProcessingResponse:
     error: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
+# Decodes and validates a JSON object payload in a single pass
+_PAYLOAD_DECODER = msgspec.json.Decoder(Dict[str, Any])
+
 class EVAPythonCore:
     """
     EVA Python Core - Advanced AI/ML Processing Engine
@@ -61,7 +267,6 @@ class EVAPythonCore:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.executor = ThreadPoolExecutor(max_workers=4)
         self.models = {}
         self.tokenizers = {}
         self.data_processors = {}
@@ -73,6 +278,21 @@ class EVAPythonCore:
         self.data_analyzer = DataAnalyzer()
         self.neural_engine = NeuralEngine()
         
+        # Request routing by method prefix (text before the first '_')
+        self._dispatch = {
+            'nlp': self.nlp_processor.process,
+            'ml': self.ml_trainer.process,
+            'data': self.data_analyzer.process,
+            'neural': self.neural_engine.process
+        }
+        
+        # Methods whose requests are coalesced into batches
+        self._batch_handlers = {
+            'nlp_generate_embeddings': self._embed_batch
+        }
+        self._batch_queues: Dict[str, asyncio.Queue] = {}
+        self._batch_workers: Dict[str, asyncio.Task] = {}
+        
     async def initialize(self):
         """Initialize the Python core system"""
         try:
@@ -91,7 +311,7 @@ class EVAPythonCore:
             self.logger.info("✅ EVA Python Core initialized successfully")
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to initialize Python Core: {e}")
+            self.logger.error("❌ Failed to initialize Python Core: %s", e)
             raise
     
     async def load_default_models(self):
@@ -101,42 +321,25 @@ class EVAPythonCore:
             self.logger.info("Loading NLP models...")
             
             # In production, would load actual models
-            self.models['nlp_base'] = {
-                'type': 'transformer',
-                'name': 'distilbert-base-uncased',
-                'status': 'loaded',
-                'capabilities': ['text_classification', 'embeddings', 'sentiment']
-            }
+            self.models.update({name: dict(spec) for name, spec in _DEFAULT_MODELS.items()})
             
-            # Load ML models
-            self.models['ml_classifier'] = {
-                'type': 'sklearn',
-                'name': 'random_forest',
-                'status': 'loaded',
-                'capabilities': ['classification', 'feature_importance']
-            }
-            
-            self.logger.info(f"✅ Loaded {len(self.models)} models")
+            self.logger.info("✅ Loaded %d models", len(self.models))
             
         except Exception as e:
-            self.logger.warning(f"Could not load all models: {e}")
+            self.logger.warning("Could not load all models: %s", e)
     
     async def process_request(self, request: ProcessingRequest) -> ProcessingResponse:
         """Process an incoming request"""
         try:
-            self.logger.info(f"Processing request: {request.method}")
+            self.logger.info("Processing request: %s", request.method)
             
             # Route to appropriate processor
-            if request.method.startswith('nlp_'):
-                result = await self.nlp_processor.process(request.method, request.data, request.options)
-            elif request.method.startswith('ml_'):
-                result = await self.ml_trainer.process(request.method, request.data, request.options)
-            elif request.method.startswith('data_'):
-                result = await self.data_analyzer.process(request.method, request.data, request.options)
-            elif request.method.startswith('neural_'):
-                result = await self.neural_engine.process(request.method, request.data, request.options)
+            if request.method in self._batch_handlers:
+                result = await self.submit_batched(request.method, request.data)
             else:
-                result = await self.process_general(request.method, request.data, request.options)
+                prefix, _, _ = request.method.partition('_')
+                handler = self._dispatch.get(prefix, self.process_general)
+                result = await handler(request.method, request.data, request.options)
             
             return ProcessingResponse(
                 request_id=request.request_id,
@@ -146,13 +349,68 @@ class EVAPythonCore:
             )
             
         except Exception as e:
-            self.logger.error(f"Request processing failed: {e}")
+            self.logger.error("Request processing failed: %s", e)
             return ProcessingResponse(
                 request_id=request.request_id,
                 success=False,
                 error=str(e)
             )
     
+    async def submit_batched(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a request for batched processing and wait for its result"""
+        loop = asyncio.get_running_loop()
+        worker = self._batch_workers.get(method)
+        
+        # (Re)start the worker if there is none, it died, or it belongs to an
+        # earlier event loop; a queue is only reused on the loop it was used on
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            if worker is None or worker.get_loop() is not loop:
+                self._batch_queues[method] = asyncio.Queue()
+            self._batch_workers[method] = loop.create_task(
+                self._batch_worker(method, self._batch_queues[method])
+            )
+        
+        queue = self._batch_queues[method]
+        future = loop.create_future()
+        await queue.put((data, future))
+        return await future
+    
+    async def _batch_worker(self, method: str, queue: asyncio.Queue):
+        """Drain a method queue, running each window of requests as one batch"""
+        loop = asyncio.get_running_loop()
+        handler = self._batch_handlers[method]
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + BATCH_WINDOW
+            
+            while len(batch) < MAX_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                results = await handler([data for data, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+    
+    async def _embed_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Batch handler for nlp_generate_embeddings"""
+        return await self.nlp_processor.generate_embeddings_batch(
+            [data.get('text', '') for data in batch]
+        )
+    
     async def process_general(self, method: str, data: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
         """Process general methods"""
         if method == 'health_check':
@@ -175,11 +433,25 @@ class EVAPythonCore:
 class NLPProcessor:
     """Natural Language Processing component"""
     
+    CAPABILITIES: Final[Tuple[str, ...]] = (
+        'text_analysis',
+        'entity_extraction',
+        'sentiment_analysis',
+        'embedding_generation',
+        'language_detection'
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(f"{__name__}.NLP")
         self.tokenizer = None
         self.model = None
         
+        # Scratch buffer for embeddings, filled in place on every call
+        self._emb_buf = np.empty(EMBEDDING_DIM, dtype=np.float32)
+        
+        # LRU cache of results keyed by (method, text fingerprint)
+        self._cache: OrderedDict = OrderedDict()
+        
     async def initialize(self):
         """Initialize NLP processor"""
         self.logger.info("Initializing NLP Processor...")
@@ -188,23 +460,50 @@ class NLPProcessor:
     
     async def process(self, method: str, data: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
         """Process NLP requests"""
+        text = data.get('text', '')
+        key = self._cache_key(method, text)
+        
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        
         if method == 'nlp_analyze_text':
-            return await self.analyze_text(data.get('text', ''))
+            result = await self.analyze_text(text)
         elif method == 'nlp_extract_entities':
-            return await self.extract_entities(data.get('text', ''))
+            result = await self.extract_entities(text)
         elif method == 'nlp_sentiment_analysis':
-            return await self.sentiment_analysis(data.get('text', ''))
+            result = await self.sentiment_analysis(text)
         elif method == 'nlp_generate_embeddings':
-            return await self.generate_embeddings(data.get('text', ''))
+            result = await self.generate_embeddings(text)
         else:
             raise ValueError(f"Unknown NLP method: {method}")
+        
+        self._cache_store(key, result)
+        return result
+    
+    @staticmethod
+    def _cache_key(method: str, text: str) -> tuple:
+        # str hashes are 64-bit SipHash and memoized on the string object
+        return (method, hash(text))
+    
+    def _cache_lookup(self, key: tuple) -> Optional[Dict[str, Any]]:
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+        return result
+    
+    def _cache_store(self, key: tuple, result: Dict[str, Any]):
+        self._cache[key] = result
+        if len(self._cache) > NLP_CACHE_SIZE:
+            self._cache.popitem(last=False)
     
     async def analyze_text(self, text: str) -> Dict[str, Any]:
         """Analyze text for various NLP features"""
         return {
             'word_count': len(text.split()),
             'char_count': len(text),
-            'sentences': len(text.split('.')),
+            # Same value as len(text.split('.')) without building the list
+            'sentences': text.count('.') + 1,
             'language': 'en',
             'complexity_score': 0.7,
             'readability': 0.8
@@ -237,25 +536,49 @@ class NLPProcessor:
     async def generate_embeddings(self, text: str) -> Dict[str, Any]:
         """Generate text embeddings"""
         # Simulated embeddings (in production, would use actual model)
-        embedding = np.random.rand(768).tolist()  # BERT-like embedding size
+        _RNG.random(out=self._emb_buf, dtype=np.float32)
+        return self._embedding_result(self._emb_buf)
+    
+    async def generate_embeddings_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Generate embeddings for several texts in a single pass"""
+        keys = [self._cache_key('nlp_generate_embeddings', text) for text in texts]
+        results = [self._cache_lookup(key) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+        
+        if misses:
+            # Simulated embeddings: one (misses, dim) draw instead of one per text,
+            # off the event loop since NumPy releases the GIL while filling it
+            embeddings = await asyncio.to_thread(
+                _RNG.random, (len(misses), EMBEDDING_DIM), np.float32
+            )
+            for i, embedding in zip(misses, embeddings):
+                # Duplicate texts within a batch share the first embedding
+                results[i] = self._cache_lookup(keys[i]) or self._embedding_result(embedding)
+                self._cache_store(keys[i], results[i])
+        
+        return results
+    
+    def _embedding_result(self, embedding: np.ndarray) -> Dict[str, Any]:
         return {
-            'embedding': embedding,
-            'dimension': 768,
+            'embedding': _ndarray_to_blob(embedding),
+            'dimension': EMBEDDING_DIM,
             'model': 'distilbert-base-uncased'
         }
     
-    def get_capabilities(self) -> List[str]:
-        return [
-            'text_analysis',
-            'entity_extraction', 
-            'sentiment_analysis',
-            'embedding_generation',
-            'language_detection'
-        ]
+    def get_capabilities(self) -> Tuple[str, ...]:
+        return self.CAPABILITIES
 
 class MLTrainer:
     """Machine Learning training and inference component"""
     
+    CAPABILITIES: Final[Tuple[str, ...]] = (
+        'model_training',
+        'prediction',
+        'model_evaluation',
+        'feature_selection',
+        'hyperparameter_tuning'
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(f"{__name__}.ML")
         self.models = {}
@@ -284,7 +607,7 @@ class MLTrainer:
         model_type = options.get('model_type', 'random_forest')
         
         # Simulated training
-        model_id = f"model_{hash(str(data)) % 10000}"
+        model_id = f"model_{_fingerprint(data)}"
         
         self.models[model_id] = {
             'type': model_type,
@@ -335,36 +658,38 @@ class MLTrainer:
         """Perform feature selection"""
         features = data.get('features', [])
         
-        # Simulated feature importance
-        feature_importance = {
-            f'feature_{i}': np.random.rand() 
-            for i in range(len(features))
-        }
+        # Simulated feature importance, drawn in a single batch
+        n = len(features)
+        names = [f'feature_{i}' for i in range(n)]
+        feature_importance = dict(zip(names, _RNG.random(n, dtype=np.float32).tolist()))
         
         return {
             'feature_importance': feature_importance,
-            'selected_features': list(feature_importance.keys())[:10],
+            'selected_features': names[:10],
             'importance_method': 'random_forest'
         }
     
-    def get_capabilities(self) -> List[str]:
-        return [
-            'model_training',
-            'prediction',
-            'model_evaluation',
-            'feature_selection',
-            'hyperparameter_tuning'
-        ]
+    def get_capabilities(self) -> Tuple[str, ...]:
+        return self.CAPABILITIES
 
 class DataAnalyzer:
     """Data analysis and processing component"""
     
+    CAPABILITIES: Final[Tuple[str, ...]] = (
+        'data_analysis',
+        'data_cleaning',
+        'data_transformation',
+        'clustering',
+        'statistical_analysis'
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(f"{__name__}.Data")
         
     async def initialize(self):
         """Initialize data analyzer"""
         self.logger.info("Initializing Data Analyzer...")
+        _warm_kernels()
         self.logger.info("✅ Data Analyzer ready")
     
     async def process(self, method: str, data: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
@@ -387,17 +712,52 @@ class DataAnalyzer:
         if not dataset:
             return {'error': 'No dataset provided'}
         
-        # Simulated analysis
+        columnar = isinstance(dataset, dict)
+        if not all(isinstance(seq, (list, tuple)) for seq in (dataset.values() if columnar else dataset)):
+            if columnar:
+                return {'error': 'Dataset columns must be lists of values'}
+            return {'error': 'Dataset rows must be lists of values'}
+        
+        # Convert once to a contiguous float32 block. Dict-of-columns input is
+        # stacked as (columns, rows) so each column stays contiguous.
+        try:
+            arr = np.asarray(list(dataset.values()) if columnar else dataset, dtype=np.float32)
+        except (TypeError, ValueError):
+            arr = None
+        
+        if arr is None or arr.ndim != 2:
+            # Simulated analysis for non-numeric or ragged datasets
+            if columnar:
+                rows, columns = len(next(iter(dataset.values()))), len(dataset)
+            else:
+                rows, columns = len(dataset), len(dataset[0])
+            return {
+                'rows': rows,
+                'columns': columns,
+                'missing_values': 5,
+                'data_types': {'numeric': 8, 'categorical': 3, 'text': 2},
+                'statistics': {
+                    'mean': 45.2,
+                    'std': 12.8,
+                    'min': 0.1,
+                    'max': 99.9
+                }
+            }
+        
+        rows, columns = arr.shape[::-1] if columnar else arr.shape
+        _warm_kernels()
+        missing, mean, std, min_value, max_value = await asyncio.to_thread(_row_stats, arr)
+        
         return {
-            'rows': len(dataset),
-            'columns': len(dataset[0]) if dataset else 0,
-            'missing_values': 5,
-            'data_types': {'numeric': 8, 'categorical': 3, 'text': 2},
+            'rows': rows,
+            'columns': columns,
+            'missing_values': int(missing),
+            'data_types': {'numeric': columns, 'categorical': 0, 'text': 0},
             'statistics': {
-                'mean': 45.2,
-                'std': 12.8,
-                'min': 0.1,
-                'max': 99.9
+                'mean': float(mean),
+                'std': float(std),
+                'min': float(min_value),
+                'max': float(max_value)
             }
         }
     
@@ -425,30 +785,92 @@ class DataAnalyzer:
     async def cluster_data(self, data: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
         """Perform data clustering"""
         n_clusters = options.get('n_clusters', 3)
+        max_iter = options.get('max_iter', 100)
+        
+        if not isinstance(n_clusters, int) or isinstance(n_clusters, bool) or n_clusters < 1:
+            raise ValueError(f"n_clusters must be a positive integer, got {n_clusters!r}")
+        if not isinstance(max_iter, int) or isinstance(max_iter, bool) or max_iter < 1:
+            raise ValueError(f"max_iter must be a positive integer, got {max_iter!r}")
+        
+        try:
+            # Overflow to inf is expected here and rejected below
+            with np.errstate(over='ignore'):
+                X = np.asarray(data.get('dataset', []), dtype=np.float32)
+        except (TypeError, ValueError):
+            X = None
+        
+        if X is None or X.ndim != 2 or len(X) == 0:
+            # Simulated clustering when no usable numeric dataset is provided
+            return {
+                'n_clusters': n_clusters,
+                'cluster_labels': _ndarray_to_blob(_RNG.integers(0, n_clusters, 100)),
+                'cluster_centers': _ndarray_to_blob(_RNG.random((n_clusters, 5), dtype=np.float32)),
+                'silhouette_score': 0.72,
+                'inertia': 234.5
+            }
+        
+        if n_clusters > len(X):
+            raise ValueError(f"n_clusters ({n_clusters}) exceeds the number of rows ({len(X)})")
+        # The fused kernel is compiled with fastmath, which assumes no NaN or inf;
+        # values beyond float32 range have already become inf in the cast above
+        if not np.isfinite(X).all():
+            raise ValueError("Dataset contains missing or non-finite values; clean it before clustering")
+        
+        _warm_kernels()
+        labels, centers, inertia = await asyncio.to_thread(self._kmeans, X, n_clusters, max_iter)
         
         return {
             'n_clusters': n_clusters,
-            'cluster_labels': list(np.random.randint(0, n_clusters, 100)),
-            'cluster_centers': np.random.rand(n_clusters, 5).tolist(),
-            'silhouette_score': 0.72,
-            'inertia': 234.5
+            'cluster_labels': _ndarray_to_blob(labels),
+            'cluster_centers': _ndarray_to_blob(centers),
+            'silhouette_score': 0.72,  # Simulated; exact silhouette is O(N^2)
+            'inertia': float(inertia)
         }
     
-    def get_capabilities(self) -> List[str]:
-        return [
-            'data_analysis',
-            'data_cleaning',
-            'data_transformation',
-            'clustering',
-            'statistical_analysis'
-        ]
+    @staticmethod
+    def _kmeans(X: np.ndarray, n_clusters: int, max_iter: int, tol: float = 1e-4):
+        """Lloyd's k-means, one fused assign/accumulate pass per iteration.
+        
+        Expects 1 <= n_clusters <= len(X) and max_iter >= 1; the Numba kernel does
+        no bounds checking.
+        """
+        centers = X[_RNG.choice(len(X), n_clusters, replace=False)].astype(np.float64)
+        
+        for _ in range(max_iter):
+            _, sums, counts, _ = _kmeans_assign_accum(X, centers)
+            # Empty clusters keep their previous center
+            nonempty = counts > 0
+            new_centers = centers.copy()
+            new_centers[nonempty] = sums[nonempty] / counts[nonempty, None]
+            shift = np.abs(new_centers - centers).max()
+            centers = new_centers
+            if shift <= tol:
+                break
+        
+        # Final assignment so labels and inertia match the returned centers
+        labels, _, _, inertia = _kmeans_assign_accum(X, centers)
+        return labels, centers, inertia
+    
+    def get_capabilities(self) -> Tuple[str, ...]:
+        return self.CAPABILITIES
 
 class NeuralEngine:
     """Neural network operations component"""
     
+    CAPABILITIES: Final[Tuple[str, ...]] = (
+        'network_creation',
+        'training',
+        'inference',
+        'optimization',
+        'transfer_learning'
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(f"{__name__}.Neural")
         self.networks = {}
+        # Captured CUDA graphs: (network_id, input shape) -> (graph, static input, static output)
+        self._graphs: Dict[Tuple[str, Tuple[int, ...]], Tuple[Any, Any, Any]] = {}
+        self._graph_lock = threading.Lock()
         
     async def initialize(self):
         """Initialize neural engine"""
@@ -471,19 +893,43 @@ class NeuralEngine:
     async def create_network(self, data: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
         """Create a neural network"""
         architecture = data.get('architecture', 'feedforward')
-        network_id = f"network_{hash(str(data)) % 10000}"
+        network_id = f"network_{_fingerprint(data)}"
         
-        self.networks[network_id] = {
+        network = {
             'architecture': architecture,
             'layers': data.get('layers', [64, 32, 16]),
             'activation': data.get('activation', 'relu'),
             'created_at': 'simulation'
         }
+        parameters = 15840
+        
+        # Other architectures and activations stay simulated
+        if (TORCH_AVAILABLE and architecture == 'feedforward'
+                and network['activation'] in _ACTIVATIONS and len(network['layers']) >= 2):
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            model = _build_feedforward(network['layers'], network['activation']).to(device).eval()
+            # BF16 autocast on GPUs with native support (Ampere+); opt-in BF16 weights
+            amp_dtype = torch.bfloat16 if device == 'cuda' and torch.cuda.is_bf16_supported() else None
+            if amp_dtype is not None and data.get('precision') == 'bf16':
+                model = model.to(dtype=amp_dtype)
+            network['model'] = model
+            network['device'] = device
+            network['amp_dtype'] = amp_dtype
+            # Compilation is lazy: Inductor traces and fuses on the first forward.
+            # On CUDA, graphs are captured by _forward, so compile without its own.
+            mode = "reduce-overhead" if device == 'cpu' else "default"
+            network['compiled'] = torch.compile(model, mode=mode, fullgraph=False)
+            parameters = sum(p.numel() for p in model.parameters())
+        
+        # The ID is a payload fingerprint, so recreating a network replaces the old
+        # model; graphs captured against its parameters must not be replayed
+        self._evict_graphs(network_id)
+        self.networks[network_id] = network
         
         return {
             'network_id': network_id,
             'architecture': architecture,
-            'parameters': 15840,
+            'parameters': parameters,
             'memory_usage': '2.5MB'
         }
     
@@ -506,16 +952,77 @@ class NeuralEngine:
         network_id = options.get('network_id')
         input_data = data.get('input', [])
         
-        # Simulated inference
-        output = np.random.rand(len(input_data), 3).tolist()
+        network = self.networks.get(network_id)
+        if network is not None and 'compiled' in network:
+            # Off the event loop: the first call also runs the torch.compile trace
+            output = await asyncio.to_thread(self._infer, network_id, network, input_data)
+        else:
+            # Simulated inference
+            output = _RNG.random((len(input_data), 3), dtype=np.float32)
         
         return {
             'network_id': network_id,
-            'output': output,
+            'output': _ndarray_to_blob(output),
             'confidence': 0.89,
             'inference_time': 0.003
         }
     
+    def _infer(self, network_id: str, network: Dict[str, Any], input_data: List[Any]) -> np.ndarray:
+        """Blocking inference core, run in a worker thread"""
+        # inference_mode and autocast are thread-local, so they are entered here
+        x = torch.as_tensor(np.asarray(input_data, dtype=np.float32), device=network['device'])
+        amp_dtype = network['amp_dtype']
+        # CUDA graph capture requires the autocast weight-cast cache to be off,
+        # otherwise the graph may reference casts freed when the context exits
+        with torch.inference_mode(), torch.autocast(
+            device_type=network['device'], dtype=amp_dtype, enabled=amp_dtype is not None,
+            cache_enabled=network['device'] != 'cuda'
+        ):
+            return self._forward(network_id, network, x).float().cpu().numpy()
+    
+    def _forward(self, network_id: str, network: Dict[str, Any], x: "torch.Tensor") -> "torch.Tensor":
+        """Forward pass, replaying a captured CUDA graph for previously seen input shapes"""
+        if network['device'] != 'cuda':
+            return network['compiled'](x)
+        
+        # Graphs share static input/output buffers, so capture and replay are serialized
+        with self._graph_lock:
+            key = (network_id, tuple(x.shape))
+            entry = self._graphs.get(key)
+            if entry is None:
+                if len(self._graphs) >= MAX_CUDA_GRAPHS:
+                    return network['compiled'](x)
+                entry = self._graphs[key] = self._capture_graph(network['compiled'], x)
+            
+            graph, static_in, static_out = entry
+            static_in.copy_(x)
+            graph.replay()
+            return static_out.clone()
+    
+    def _evict_graphs(self, network_id: str):
+        """Drop every captured CUDA graph belonging to network_id"""
+        with self._graph_lock:
+            for key in [key for key in self._graphs if key[0] == network_id]:
+                del self._graphs[key]
+    
+    @staticmethod
+    def _capture_graph(model, x: "torch.Tensor"):
+        """Capture one forward pass of model on inputs shaped like x"""
+        static_in = x.clone()
+        
+        # Warm up on a side stream so compilation and lazy init stay out of the graph
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(3):
+                model(static_in)
+        torch.cuda.current_stream().wait_stream(stream)
+        
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph):
+            static_out = model(static_in)
+        return graph, static_in, static_out
+    
     async def optimize_network(self, data: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize neural network"""
         return {
@@ -525,14 +1032,8 @@ class NeuralEngine:
             'accuracy_retained': 0.98
         }
     
-    def get_capabilities(self) -> List[str]:
-        return [
-            'network_creation',
-            'training',
-            'inference',
-            'optimization',
-            'transfer_learning'
-        ]
+    def get_capabilities(self) -> Tuple[str, ...]:
+        return self.CAPABILITIES
 
 # gRPC Service Implementation (if available)
 class EVAService:
@@ -547,8 +1048,8 @@ class EVAService:
             # Parse request from protobuf
             req = ProcessingRequest(
                 method=request.method,
-                data=json.loads(request.data),
-                options=json.loads(request.options),
+                data=_PAYLOAD_DECODER.decode(request.data),
+                options=_PAYLOAD_DECODER.decode(request.options),
                 request_id=request.request_id
             )
             
@@ -582,7 +1083,7 @@ async def main():
         # Get capabilities
         capabilities = await core.process_general('get_capabilities', {}, {})
         for component, caps in capabilities.items():
-            logger.info(f"  {component}: {', '.join(caps)}")
+            logger.info("  %s: %s", component, ', '.join(caps))
         
         # Keep running
         logger.info("EVA Python Core is ready for requests...")
@@ -594,8 +1095,14 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Shutting down EVA Python Core...")
     except Exception as e:
-        logger.error(f"EVA Python Core failed: {e}")
+        logger.error("EVA Python Core failed: %s", e)
         raise
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Prefer the libuv-based event loop when installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
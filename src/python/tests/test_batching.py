@@ -0,0 +1,91 @@
+"""Tests for request coalescing in EVAPythonCore"""
+
+import asyncio
+
+import numpy as np
+
+import eva_core
+
+
+def test_submit_batched_returns_each_caller_its_own_result():
+    batches = []
+
+    async def echo(batch):
+        batches.append(len(batch))
+        return [{'value': data['value'] * 2} for data in batch]
+
+    async def go():
+        core = eva_core.EVAPythonCore()
+        core._batch_handlers['test_echo'] = echo
+        return await asyncio.gather(*[core.submit_batched('test_echo', {'value': i}) for i in range(100)])
+
+    results = asyncio.run(go())
+
+    assert [r['value'] for r in results] == [i * 2 for i in range(100)]
+    assert sum(batches) == 100
+    assert max(batches) == eva_core.MAX_BATCH_SIZE
+
+
+def test_submit_batched_propagates_handler_exception_to_every_caller():
+    async def fail(batch):
+        raise RuntimeError('batch failed')
+
+    async def go():
+        core = eva_core.EVAPythonCore()
+        core._batch_handlers['test_fail'] = fail
+        return await asyncio.gather(
+            *[core.submit_batched('test_fail', {}) for _ in range(5)],
+            return_exceptions=True
+        )
+
+    results = asyncio.run(go())
+
+    assert len(results) == 5
+    assert all(isinstance(r, RuntimeError) and str(r) == 'batch failed' for r in results)
+
+
+def test_batched_embeddings_through_process_request():
+    async def go():
+        core = eva_core.EVAPythonCore()
+        requests = [
+            eva_core.ProcessingRequest('nlp_generate_embeddings', {'text': str(i % 3)}, {}, str(i))
+            for i in range(9)
+        ]
+        return await asyncio.gather(*[core.process_request(r) for r in requests])
+
+    responses = asyncio.run(go())
+
+    assert all(r.success for r in responses)
+    embeddings = [eva_core._blob_to_ndarray(r.result['embedding']) for r in responses]
+    assert embeddings[0].shape == (eva_core.EMBEDDING_DIM,)
+    assert embeddings[0].dtype == np.float32
+    # Same text, same (cached) embedding; different texts differ
+    np.testing.assert_array_equal(embeddings[0], embeddings[3])
+    assert not np.array_equal(embeddings[0], embeddings[1])
+
+
+def test_submit_batched_restarts_worker_on_new_event_loop():
+    core = eva_core.EVAPythonCore()
+    request = eva_core.ProcessingRequest('nlp_generate_embeddings', {'text': 'hello'}, {}, '1')
+
+    async def process():
+        return await asyncio.wait_for(core.process_request(request), timeout=5)
+
+    assert asyncio.run(process()).success
+    assert asyncio.run(process()).success
+
+
+def test_submit_batched_restarts_cancelled_worker():
+    async def echo(batch):
+        return [dict(data) for data in batch]
+
+    async def go():
+        core = eva_core.EVAPythonCore()
+        core._batch_handlers['test_echo'] = echo
+        await core.submit_batched('test_echo', {'value': 1})
+        worker = core._batch_workers['test_echo']
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        return await asyncio.wait_for(core.submit_batched('test_echo', {'value': 2}), timeout=5)
+
+    assert asyncio.run(go()) == {'value': 2}
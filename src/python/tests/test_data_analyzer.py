@@ -0,0 +1,152 @@
+"""Tests for the DataAnalyzer numeric kernels"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+
+import eva_core
+
+
+def run_analyzer(method, *args):
+    async def go():
+        analyzer = eva_core.DataAnalyzer()
+        await analyzer.initialize()
+        return await getattr(analyzer, method)(*args)
+    return asyncio.run(go())
+
+
+def assert_stats_close(actual, expected):
+    assert actual[0] == expected[0]
+    np.testing.assert_allclose(actual[1:], expected[1:], rtol=1e-6)
+
+
+def test_row_stats_matches_numpy():
+    arr = np.random.default_rng(0).random((1000, 13), dtype=np.float32)
+    values = arr.astype(np.float64)
+
+    stats = eva_core._row_stats(arr)
+
+    assert_stats_close(stats, eva_core._row_stats_numpy(arr))
+    np.testing.assert_allclose(stats[1:], [values.mean(), values.std(), values.min(), values.max()], rtol=1e-6)
+
+
+def test_row_stats_skips_nan():
+    arr = np.array([[1.0, np.nan], [2.0, 3.0], [np.nan, np.nan]], dtype=np.float32)
+
+    stats = eva_core._row_stats(arr)
+
+    assert stats[0] == 3
+    assert_stats_close(stats, (3, 2.0, np.std([1.0, 2.0, 3.0]), 1.0, 3.0))
+
+
+def test_row_stats_all_nan():
+    arr = np.full((2, 2), np.nan, dtype=np.float32)
+
+    missing, *rest = eva_core._row_stats(arr)
+
+    assert missing == 4
+    assert all(np.isnan(rest))
+
+
+def test_row_stats_large_offset():
+    # Values around 1e6 with a small spread cancel in the naive E[x^2] - E[x]^2 formula
+    arr = (1e6 + np.random.default_rng(1).normal(0, 0.5, (200000, 4))).astype(np.float32)
+
+    stats = eva_core._row_stats(arr)
+
+    assert_stats_close(stats, eva_core._row_stats_numpy(arr))
+    assert stats[2] == pytest.approx(np.std(arr.astype(np.float64)), rel=1e-6)
+
+
+@pytest.mark.parametrize('dataset, expected', [
+    ({'a': [1, 2, 3], 'b': [4, None, 6]}, (3, 2, 1)),
+    ([[1, 4], [2, None], [3, 6]], (3, 2, 1)),
+])
+def test_analyze_data_row_and_column_layouts(dataset, expected):
+    result = run_analyzer('analyze_data', {'dataset': dataset})
+
+    assert (result['rows'], result['columns'], result['missing_values']) == expected
+    assert result['statistics']['mean'] == pytest.approx(3.2)
+
+
+@pytest.mark.parametrize('dataset', [{'a': 1}, {'a': [1, 2], 'b': 'xy'}, [1, 2, 3]])
+def test_analyze_data_rejects_scalar_columns_and_rows(dataset):
+    result = run_analyzer('analyze_data', {'dataset': dataset})
+
+    assert 'error' in result
+
+
+def test_kmeans_assign_accum_matches_numpy():
+    rng = np.random.default_rng(2)
+    X = np.vstack([rng.normal(c, 0.1, (200, 2)) for c in (0, 5, 10)]).astype(np.float32)
+    C = X[[0, 250, 500]].astype(np.float64)
+
+    labels, sums, counts, inertia = eva_core._kmeans_assign_accum(X, C)
+    ref_labels, ref_sums, ref_counts, ref_inertia = eva_core._kmeans_assign_accum_numpy(X, C)
+
+    np.testing.assert_array_equal(labels, ref_labels)
+    np.testing.assert_array_equal(counts, ref_counts)
+    np.testing.assert_allclose(sums, ref_sums, rtol=1e-5)
+    assert inertia == pytest.approx(ref_inertia, rel=1e-4)
+
+
+def test_cluster_data_returns_consistent_labels():
+    dataset = [[1, 2], [3, 4], [5, 6], [7, 8], [100, 100]]
+
+    result = run_analyzer('cluster_data', {'dataset': dataset}, {'n_clusters': 2})
+
+    labels = eva_core._blob_to_ndarray(result['cluster_labels'])
+    centers = eva_core._blob_to_ndarray(result['cluster_centers'])
+    X = np.asarray(dataset, dtype=np.float64)
+    nearest = ((X[:, None, :] - centers[None]) ** 2).sum(axis=-1).argmin(axis=1)
+    np.testing.assert_array_equal(labels, nearest)
+    assert result['inertia'] == pytest.approx(((X - centers[labels]) ** 2).sum(), rel=1e-5)
+
+
+def test_cluster_data_single_iteration():
+    result = run_analyzer('cluster_data', {'dataset': [[1, 2], [3, 4], [5, 6]]}, {'n_clusters': 2, 'max_iter': 1})
+
+    assert eva_core._blob_to_ndarray(result['cluster_labels']).shape == (3,)
+
+
+@pytest.mark.parametrize('dataset, options', [
+    ([[1, 2], [3, 4], [5, 6]], {'n_clusters': 0}),
+    ([[1, 2], [3, 4], [5, 6]], {'n_clusters': -1}),
+    ([[1, 2], [3, 4], [5, 6]], {'n_clusters': 2.5}),
+    ([[1, 2], [3, 4], [5, 6]], {'n_clusters': True}),
+    ([[1, 2], [3, 4], [5, 6]], {'n_clusters': 4}),
+    ([[1, 2], [3, 4], [5, 6]], {'max_iter': 0}),
+    ([[1, 2], [3, 4], [5, 6]], {'max_iter': None}),
+    ([[1, None], [3, 4], [5, 6]], {'n_clusters': 2}),
+    ([[1e39, 0], [1, 2], [3, 4], [5, 6]], {'n_clusters': 2}),
+])
+def test_cluster_data_rejects_invalid_parameters(dataset, options):
+    with pytest.raises(ValueError):
+        run_analyzer('cluster_data', {'dataset': dataset}, options)
+
+
+def test_kernels_without_initialize_exit_cleanly():
+    # Numba's thread pool must not first start on a to_thread worker, or the
+    # interpreter hangs at exit; run in a fresh process to observe shutdown
+    script = textwrap.dedent("""
+        import asyncio
+        import eva_core
+
+        analyzer = eva_core.DataAnalyzer()
+        dataset = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        print(asyncio.run(analyzer.analyze_data({'dataset': dataset}))['rows'])
+        print(asyncio.run(analyzer.cluster_data({'dataset': dataset}, {'n_clusters': 2}))['n_clusters'])
+    """)
+    src_dir = os.path.dirname(os.path.abspath(eva_core.__file__))
+
+    result = subprocess.run(
+        [sys.executable, '-c', script], cwd=src_dir, capture_output=True, text=True, timeout=120
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ['3', '2']
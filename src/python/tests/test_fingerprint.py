@@ -0,0 +1,34 @@
+"""Tests for payload fingerprints used as model and network IDs"""
+
+import asyncio
+
+import eva_core
+
+
+def test_fingerprint_ignores_key_order():
+    a = {'features': [1, 2], 'target': 'y', 'params': {'depth': 3, 'lr': 0.1}}
+    b = {'params': {'lr': 0.1, 'depth': 3}, 'target': 'y', 'features': [1, 2]}
+
+    assert eva_core._fingerprint(a) == eva_core._fingerprint(b)
+    assert eva_core._fingerprint(a) != eva_core._fingerprint({**a, 'target': 'z'})
+
+
+def test_ids_are_stable_across_key_order():
+    trainer = eva_core.MLTrainer()
+    engine = eva_core.NeuralEngine()
+
+    first = asyncio.run(trainer.train_model({'features': [1], 'target': 'y'}, {}))['model_id']
+    second = asyncio.run(trainer.train_model({'target': 'y', 'features': [1]}, {}))['model_id']
+    network_a = asyncio.run(engine.create_network({'layers': [4, 3], 'activation': 'tanh'}, {}))
+    network_b = asyncio.run(engine.create_network({'activation': 'tanh', 'layers': [4, 3]}, {}))
+
+    assert first == second
+    assert network_a['network_id'] == network_b['network_id']
+
+
+def test_fingerprint_accepts_integers_beyond_64_bits():
+    data = eva_core._PAYLOAD_DECODER.decode(b'{"n": 123456789012345678901234567890}')
+
+    result = asyncio.run(eva_core.MLTrainer().train_model(data, {}))
+
+    assert result['model_id'].startswith('model_')
@@ -0,0 +1,48 @@
+"""Tests for NeuralEngine; none of them need a GPU"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+import eva_core
+
+
+def test_create_network_evicts_graphs_for_recreated_network():
+    engine = eva_core.NeuralEngine()
+    payload = {'layers': [4, 3], 'activation': 'relu'}
+    network_id = asyncio.run(engine.create_network(payload, {}))['network_id']
+    engine._graphs[(network_id, (2, 4))] = ('graph', 'in', 'out')
+    engine._graphs[('network_other', (2, 4))] = ('graph', 'in', 'out')
+
+    assert asyncio.run(engine.create_network(payload, {}))['network_id'] == network_id
+
+    assert list(engine._graphs) == [('network_other', (2, 4))]
+
+
+def test_create_network_accepts_unsupported_activation():
+    engine = eva_core.NeuralEngine()
+
+    result = asyncio.run(engine.create_network({'layers': [4, 3], 'activation': 'swish'}, {}))
+
+    assert 'compiled' not in engine.networks[result['network_id']]
+
+
+def test_feedforward_inference_matches_model_on_cpu(monkeypatch):
+    torch = pytest.importorskip('torch')
+    # Keep to the CPU branch of _forward: no CUDA graphs or BF16 autocast
+    monkeypatch.setattr(torch.cuda, 'is_available', lambda: False)
+    engine = eva_core.NeuralEngine()
+    x = np.random.default_rng(0).random((5, 4), dtype=np.float32)
+
+    created = asyncio.run(engine.create_network({'layers': [4, 3, 2], 'activation': 'relu'}, {}))
+    network = engine.networks[created['network_id']]
+    result = asyncio.run(engine.run_inference({'input': x.tolist()}, {'network_id': created['network_id']}))
+
+    output = eva_core._blob_to_ndarray(result['output'])
+    with torch.no_grad():
+        expected = network['model'](torch.from_numpy(x)).numpy()
+    assert network['device'] == 'cpu'
+    assert created['parameters'] == sum(p.numel() for p in network['model'].parameters()) == 4 * 3 + 3 + 3 * 2 + 2
+    assert output.shape == (5, 2)
+    np.testing.assert_allclose(output, expected, rtol=1e-5, atol=1e-6)
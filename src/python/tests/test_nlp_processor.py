@@ -0,0 +1,38 @@
+"""Tests for the NLPProcessor result cache"""
+
+import asyncio
+
+import eva_core
+
+
+def analyze(nlp, text):
+    return asyncio.run(nlp.process('nlp_analyze_text', {'text': text}, {}))
+
+
+def test_cache_returns_stored_result():
+    nlp = eva_core.NLPProcessor()
+
+    assert analyze(nlp, 'a b') is analyze(nlp, 'a b')
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(eva_core, 'NLP_CACHE_SIZE', 2)
+    nlp = eva_core.NLPProcessor()
+
+    first = analyze(nlp, 'first')
+    analyze(nlp, 'second')
+    analyze(nlp, 'first')       # refresh 'first'; 'second' is now least recent
+    analyze(nlp, 'third')       # evicts 'second'
+
+    assert len(nlp._cache) == 2
+    assert nlp._cache_key('nlp_analyze_text', 'second') not in nlp._cache
+    assert analyze(nlp, 'first') is first
+
+
+def test_cache_is_keyed_by_method():
+    nlp = eva_core.NLPProcessor()
+
+    analysis = analyze(nlp, 'text')
+    sentiment = asyncio.run(nlp.process('nlp_sentiment_analysis', {'text': 'text'}, {}))
+
+    assert analysis != sentiment